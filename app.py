@@ -16,6 +16,11 @@ from flask import Flask, render_template, jsonify, redirect, request, session, s
 from flask_socketio import SocketIO
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster encoding of Socket.IO packets
+except ImportError:
+    orjson = None
+
 # New Architecture Imports
 from server.core.session_manager import SessionManager
 from server.core.event_router import EventRouter
@@ -35,8 +40,22 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__, static_folder='dist', static_url_path='')
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'y2k-party-secret-key-2025')
 
+class OrjsonCodec:
+    """Drop-in for the json module in Socket.IO packet encoding, backed by orjson."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson output is already compact, so separators etc. are ignored
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Socket.IO with CORS for local network access
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio_options = {'json': OrjsonCodec} if orjson is not None else {}
+socketio = SocketIO(app, cors_allowed_origins="*", **socketio_options)
 
 # Initialize System
 session_manager = SessionManager(data_dir='data')
@@ -115,7 +115,7 @@ class RoundTimer:
 
         self._broadcast_sync('running')
         self._schedule_tick()
-        logger.info(f"Round timer started: {duration_seconds}s")
+        logger.info("Round timer started: %ss", duration_seconds)
 
     def pause(self):
         """Pause the timer."""
@@ -186,7 +186,7 @@ class RoundTimer:
             self._broadcast_sync('running')
             self._schedule_tick()
         except Exception as e:
-            logger.error(f"Round timer tick error: {e}")
+            logger.error("Round timer tick error: %s", e)
 
     def _broadcast_sync(self, status: str):
         """Broadcast timer state to all clients."""
@@ -268,7 +268,10 @@ def register_events(sio, sm, er, gr):
 
     # Dynamic Game Event Registration
     for event_name in game_registry.get_all_events():
-        sio.on_event(event_name, make_handler(event_name))
+        if game_registry.is_admin_event(event_name):
+            sio.on_event(event_name, make_admin_handler(event_name))
+        else:
+            sio.on_event(event_name, make_handler(event_name))
 
     logger.info("Socket.IO events registered (New Architecture)")
 
@@ -280,6 +283,13 @@ def make_handler(event_name):
         event_router.handle_event(event_name, data, request.sid)
     return handler
 
+def make_admin_handler(event_name):
+    def handler(data=None):
+        if data is None: data = {}
+        # Admin clients hold no team session, so there is nothing to touch
+        event_router.handle_admin_event(event_name, data, request.sid)
+    return handler
+
 # =============================================================================
 # PLATFORM HANDLERS
 # =============================================================================
@@ -310,14 +320,11 @@ def on_connect():
                 sync_data['current_state'] = current_state
 
             emit('sync_state', sync_data)
-            emit('score_update', {
-                'scores': session_manager.get_scores(),
-                'teams': session_manager.get_teams_info()
-            })
+            emit('score_update', session_manager.get_scores_payload())
 
 def on_disconnect():
     session_id = request.sid
-    # Just log it
+    session_manager.end_session(session_id)
     logger.info(f"Client disconnected: {session_id}")
 
 def on_rejoin_session(data):
@@ -338,10 +345,7 @@ def on_rejoin_session(data):
             sync_data['current_state'] = current_state
             
         emit('sync_state', sync_data)
-        emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        emit('score_update', session_manager.get_scores_payload())
     else:
         emit('rejoin_result', {'success': False, 'message': 'Invalid session/team'})
 
@@ -353,15 +357,13 @@ def on_request_tv_sync():
         state_data = game.get_sanitized_state_data()
     else:
         state_data = session_manager.state_data
-        
+
+    event_router.flush_pending()
     emit('state_change', {
         'current_state': current_state,
         'state_data': state_data
     })
-    emit('score_update', {
-        'scores': session_manager.get_scores(),
-        'teams': session_manager.get_teams_info()
-    })
+    emit('score_update', session_manager.get_scores_payload())
 
 def on_create_team(data):
     result = session_manager.create_team(data.get('team_name', ''), data.get('player_name', ''), request.sid)
@@ -369,10 +371,8 @@ def on_create_team(data):
     
     if result['success']:
         join_room(f"team:{result['team_id']}")
-        socketio.emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        event_router.flush_pending()
+        socketio.emit('score_update', session_manager.get_scores_payload())
 
 def on_join_team(data):
     result = session_manager.join_team(data.get('join_code', ''), data.get('player_name', ''), request.sid)
@@ -381,17 +381,15 @@ def on_join_team(data):
     if result['success']:
         team_id = result['team_id']
         join_room(f"team:{team_id}")
-        
+        event_router.flush_pending()
+
         socketio.emit('player_joined', {
             'player_id': result['player_id'],
             'player_name': result['player_name'],
             'players': result['players']
         }, room=f'team:{team_id}')
         
-        socketio.emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        socketio.emit('score_update', session_manager.get_scores_payload())
 
 def on_admin_auth(data):
     password = data.get('password', '')
@@ -403,14 +401,12 @@ def on_admin_auth(data):
     })
     
     if success:
+        event_router.flush_pending()  # Queued admin events predate this admin
         join_room('admin')
         emit('state_change', {
             'current_state': session_manager.current_state
         })
-        emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        emit('score_update', session_manager.get_scores_payload())
 
 def on_set_state(data):
     new_state = data.get('new_state')
@@ -422,16 +418,18 @@ def on_set_state(data):
     # EventRouter handles state transitions (exit old, enter new)
     event_router.set_state(new_state, state_data)
 
+    # Final scores shouldn't wait on the debounce window
+    if new_state == 'VICTORY':
+        session_manager.flush()
+
 def on_add_points(data):
     team_id = data.get('team_id')
     points = data.get('points', 0)
     reason = data.get('reason', '')
     
     if session_manager.add_points(team_id, points, reason):
-        socketio.emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        event_router.flush_pending()
+        socketio.emit('score_update', session_manager.get_scores_payload())
 
 def on_reset_game(data):
     if not data.get('confirm'):
@@ -444,15 +442,14 @@ def on_reset_game(data):
     # reset_game defaults to LOBBY in session_manager logic (actually it clears things)
     # We should probably explicitly set state to LOBBY
     event_router.set_state('LOBBY', {})
+    session_manager.flush()
 
 def on_kick_team(data):
     team_id = data.get('team_id')
     if session_manager.kick_team(team_id):
+        event_router.flush_pending()
         socketio.emit('team_kicked', {'message': 'TERMINATED'}, room=f'team:{team_id}')
-        socketio.emit('score_update', {
-            'scores': session_manager.get_scores(),
-            'teams': session_manager.get_teams_info()
-        })
+        socketio.emit('score_update', session_manager.get_scores_payload())
 
 # TV Display handlers
 def on_toggle_qr_code(data):
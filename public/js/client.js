@@ -1059,6 +1059,15 @@ const SocketHandlers = {
         // Expose socket globally for screensaver and other shared components
         window.socket = AppState.socket;
 
+        // Server groups events for the same target into one 'batch' frame
+        // ({event: payload}, or [[event, payload], ...] for the admin room);
+        // replay each through its regular handlers
+        AppState.socket.on('batch', (events) => {
+            (Array.isArray(events) ? events : Object.entries(events)).forEach(([event, payload]) => {
+                AppState.socket.listeners(event).forEach(handler => handler(payload));
+            });
+        });
+
         // Heartbeat interval ID
         let heartbeatInterval = null;
         const HEARTBEAT_INTERVAL = 30000; // 30 seconds
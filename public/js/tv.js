@@ -73,7 +73,9 @@ const AppState = {
     spotifyToken: null,
     currentSpotifyUri: null,
     // Audio unlock state (browser autoplay policy)
-    audioUnlocked: false
+    audioUnlocked: false,
+    // Timeline team statuses, seeded from state_data and patched by timeline_status
+    timelineStatuses: {}
 };
 
 // ============================================================
@@ -1304,6 +1306,15 @@ const SocketHandlers = {
         // Expose socket globally for screensaver and other shared components
         window.socket = AppState.socket;
 
+        // Server groups events for the same target into one 'batch' frame
+        // ({event: payload}, or [[event, payload], ...] for the admin room);
+        // replay each through its regular handlers
+        AppState.socket.on('batch', (events) => {
+            (Array.isArray(events) ? events : Object.entries(events)).forEach(([event, payload]) => {
+                AppState.socket.listeners(event).forEach(handler => handler(payload));
+            });
+        });
+
         // Heartbeat interval
         let heartbeatInterval = null;
         const HEARTBEAT_INTERVAL = 30000; // 30 seconds
@@ -1518,7 +1529,8 @@ const SocketHandlers = {
 
         // Timeline events
         AppState.socket.on('timeline_status', (data) => {
-            UI.updateTimelineStatuses(data.team_statuses);
+            Object.assign(AppState.timelineStatuses, data.team_statuses);
+            UI.updateTimelineStatuses(AppState.timelineStatuses);
         });
 
         AppState.socket.on('timeline_complete', (data) => {
@@ -1813,6 +1825,10 @@ const SocketHandlers = {
             case 'TIMELINE':
                 document.getElementById('timeline-winner').classList.add('hidden');
                 document.getElementById('timeline-team-status').innerHTML = '';
+                AppState.timelineStatuses = { ...(data.state_data?.statuses || {}) };
+                if (Object.values(AppState.timelineStatuses).some(s => s !== 'thinking')) {
+                    UI.updateTimelineStatuses(AppState.timelineStatuses);
+                }
                 UI.hideTimelineTeamSubmissions();
                 UI.clearTimelineItems();
                 UI.updateScoreboard('timeline-scoreboard');
@@ -3,72 +3,99 @@ EventRouter: Routes Socket.IO events to the active game cartridge.
 """
 
 import logging
-from typing import Dict, Any, Optional
-from flask_socketio import emit, join_room, leave_room
-from ..games.base_game import EventResponse, EventContext
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+from ..games.base_game import BaseGame, EventResponse, EventContext
 
 logger = logging.getLogger(__name__)
 
 class EventRouter:
+    ADMIN_COALESCE_SECONDS = 0.01  # Window for grouping admin-room events into one frame
+    BROADCAST_COALESCE_SECONDS = 0.01  # Window for folding broadcast_coalesced events
+
+    # Read on every event; slots avoid the per-access instance dict lookup
+    __slots__ = (
+        'socketio', 'session_manager', 'game_registry',
+        '_current_game_id', '_current_game',
+        '_admin_lock', '_pending_admin', '_admin_flush_scheduled',
+        '_broadcast_lock', '_pending_broadcast', '_broadcast_flush_scheduled',
+    )
+
     def __init__(self, socketio, session_manager, game_registry):
         self.socketio = socketio
         self.session_manager = session_manager
         self.game_registry = game_registry
-        self.current_game_id: Optional[str] = None
+        self._current_game_id: Optional[str] = None
+        self._current_game: Optional[BaseGame] = None
+        self._admin_lock = threading.Lock()
+        self._pending_admin: List[Tuple[str, Any]] = []
+        self._admin_flush_scheduled = False
+        self._broadcast_lock = threading.Lock()
+        self._pending_broadcast: Dict[str, Any] = {}
+        self._broadcast_flush_scheduled = False
+
+    @property
+    def current_game_id(self) -> Optional[str]:
+        return self._current_game_id
+
+    @current_game_id.setter
+    def current_game_id(self, game_id: Optional[str]):
+        # Resolve the cartridge once here rather than on every event
+        self._current_game_id = game_id
+        self._current_game = self.game_registry.get_game(game_id) if game_id else None
     
     def handle_event(self, event_name: str, data: Dict[str, Any], sid: str):
         """
-        Route an event to the current game.
+        Route a player event to the current game.
         """
         # 1. Build Context
-        session_data = self.session_manager.get_team_for_session(sid)
-        team_id = None
-        player_id = None
-        team_name = ""
-        player_name = ""
-        
-        if session_data:
-            team_id = session_data.get('team_id')
-            player_id = session_data.get('player_id')
-            team = self.session_manager.get_team(team_id)
-            if team:
-                team_name = team.get('name', "")
-                if player_id:
-                    player_name = team.get('players', {}).get(player_id, {}).get('name', "")
-
-        # Check if user is in admin room to determine is_admin
-        # This is a bit of a hack, ideally we'd have a better auth check in session
-        # But for now, we can trust the room membership if managed correctly
-        # However, checking room membership via socketio in handler might be tricky or slow.
-        # Let's rely on a passed flag or separate admin auth flow. 
-        # For now, we default to False. Admin events usually come from the admin client which should be authenticated.
-        is_admin = False 
-
-        context = EventContext(
-            session_id=sid,
-            team_id=team_id,
-            player_id=player_id,
-            player_name=player_name,
-            team_name=team_name,
-            is_admin=is_admin
-        )
+        session_context = self.session_manager.get_session_context(sid)
+        if session_context:
+            team_id, player_id, team_name, player_name = session_context
+            context = EventContext(
+                session_id=sid,
+                team_id=team_id,
+                player_id=player_id,
+                player_name=player_name,
+                team_name=team_name
+            )
+        else:
+            # Unbound sessions may name their team in the payload. Kept apart
+            # from team_id so it never selects a team room for routing
+            claimed_team_id = data.get('team_id') if isinstance(data, dict) else None
+            context = EventContext(session_id=sid, claimed_team_id=claimed_team_id)
+
+        self._dispatch(event_name, data, context)
 
+    def handle_admin_event(self, event_name: str, data: Dict[str, Any], sid: str):
+        """
+        Route an admin event to the current game.
+
+        Admin clients are not on a team, so the session lookup is skipped.
+        is_admin stays False: admin auth is tracked by 'admin' room membership
+        in events.py, not per session, and no handler relies on the flag.
+        """
+        self._dispatch(event_name, data, EventContext(session_id=sid))
+
+    def _dispatch(self, event_name: str, data: Dict[str, Any], context: EventContext):
+        """
+        Hand an event to the active cartridge and emit its response.
+        """
         # 2. Find Game
         # We route to the CURRENT game.
         if not self.current_game_id:
-            logger.warning(f"No active game. Event {event_name} ignored.")
+            logger.warning("No active game. Event %s ignored.", event_name)
             return
 
-        game = self.game_registry.get_game(self.current_game_id)
+        game = self._current_game
         if not game:
-            logger.error(f"Active game {self.current_game_id} not found in registry!")
+            logger.error("Active game %s not found in registry!", self.current_game_id)
             return
 
         # Check if game handles this event (including global events)
-        if (event_name not in game.EVENTS and
-            event_name not in game.ADMIN_EVENTS and
-            event_name not in game.GLOBAL_ADMIN_EVENTS):
-             logger.debug(f"Event {event_name} not handled by current game {self.current_game_id}")
+        if event_name not in game.HANDLED_EVENTS:
+             if logger.isEnabledFor(logging.DEBUG):
+                 logger.debug("Event %s not handled by current game %s", event_name, self.current_game_id)
              return
 
         # 3. Handle
@@ -79,37 +106,37 @@ class EventRouter:
             if response:
                 self._process_response(response, context)
         except Exception as e:
-            logger.exception(f"Error handling event {event_name} in game {self.current_game_id}: {e}")
-            self.socketio.emit('error', {'code': 'GAME_ERROR', 'message': str(e)}, room=sid)
+            # logger.exception already appends the message and traceback
+            logger.exception("Error handling event %s in game %s", event_name, self.current_game_id)
+            self.socketio.emit('error', {'code': 'GAME_ERROR', 'message': str(e)}, room=context.session_id)
 
     def set_state(self, new_state: str, state_data: dict) -> bool:
         """
         Transition to a new game state.
         """
-        logger.info(f"Transitioning from {self.current_game_id} to {new_state}")
+        logger.info("Transitioning from %s to %s", self.current_game_id, new_state)
 
         # Exit current game
-        if self.current_game_id:
-            current_game = self.game_registry.get_game(self.current_game_id)
-            if current_game:
-                try:
-                    response = current_game.on_exit()
-                    self._process_response(response, None)
-                except Exception as e:
-                    logger.error(f"Error exiting game {self.current_game_id}: {e}")
+        current_game = self._current_game
+        if current_game:
+            try:
+                response = current_game.on_exit()
+                self._process_response(response, None)
+            except Exception as e:
+                logger.error("Error exiting game %s: %s", self.current_game_id, e)
 
         # Enter new game
         # We assume the 'state' string from admin matches the GAME_ID
         self.current_game_id = new_state 
-        new_game = self.game_registry.get_game(self.current_game_id)
+        new_game = self._current_game
         
         if not new_game:
-            logger.error(f"Game not found for state: {new_state}")
+            logger.error("Game not found for state: %s", new_state)
             # Fallback to LOBBY if possible?
             if new_state != 'LOBBY':
                 logger.info("Falling back to LOBBY")
                 self.current_game_id = 'LOBBY'
-                new_game = self.game_registry.get_game('LOBBY')
+                new_game = self._current_game
             
             if not new_game:
                  logger.critical("LOBBY game not found! System in bad state.")
@@ -122,11 +149,14 @@ class EventRouter:
             response = new_game.on_enter(state_data)
             self._process_response(response, None)
         except Exception as e:
-            logger.exception(f"Error entering game {new_state}: {e}")
+            logger.error("Error entering game %s: %s", new_state, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             return False
         
         # Broadcast state change (Console responsibility)
         sanitized_data = new_game.get_sanitized_state_data()
+        # Queued events from the old round go out first
+        self.flush_pending()
         self.socketio.emit('state_change', {
             'current_state': new_state,
             'state_data': sanitized_data
@@ -141,37 +171,160 @@ class EventRouter:
         if not response:
             return
 
-        # 1. Broadcast
+        team_room = f"team:{context.team_id}" if context and context.team_id else None
+        emit_batch = self._emit_batch
+
+        # Broadcasts and sender replies can reach the admin; send what is
+        # queued for it first so per-target order is kept
+        if response.broadcast or response.to_sender or response.error:
+            self._drain_admin()
+
+        # 1. Broadcast (queued coalesced broadcasts go out first; this
+        # response's own coalesced events follow its immediate ones)
         if response.broadcast:
-            for event, payload in response.broadcast.items():
-                self.socketio.emit(event, payload)
+            self._drain_broadcast()
+            emit_batch(response.broadcast)
+        if response.broadcast_coalesced:
+            self._queue_broadcast(response.broadcast_coalesced)
         
         # 2. To Sender
         if response.to_sender and context and context.session_id:
-            for event, payload in response.to_sender.items():
-                self.socketio.emit(event, payload, room=context.session_id)
+            emit_batch(response.to_sender, room=context.session_id)
 
         # 3. To Team (Sender's Team)
-        if response.to_team and context and context.team_id:
-            for event, payload in response.to_team.items():
-                self.socketio.emit(event, payload, room=f"team:{context.team_id}")
+        if response.to_team and team_room:
+            emit_batch(response.to_team, room=team_room)
 
         # 3b. To Team Others (Sender's Team excluding sender)
-        if response.to_team_others and context and context.team_id:
-            for event, payload in response.to_team_others.items():
-                self.socketio.emit(event, payload, room=f"team:{context.team_id}", skip_sid=context.session_id)
+        if response.to_team_others and team_room:
+            emit_batch(response.to_team_others, room=team_room, skip_sid=context.session_id)
 
         # 4. To Admin
         if response.to_admin:
-            for event, payload in response.to_admin.items():
-                self.socketio.emit(event, payload, room='admin')
+            self._queue_admin(response.to_admin)
 
         # 5. To Specific Teams
         if response.to_specific_team:
             for team_id, events in response.to_specific_team.items():
-                for event, payload in events.items():
-                    self.socketio.emit(event, payload, room=f"team:{team_id}")
+                if events:
+                    emit_batch(events, room=f"team:{team_id}")
 
         # 6. Error (to sender)
         if response.error and context and context.session_id:
             self.socketio.emit('error', response.error, room=context.session_id)
+
+    def _emit_batch(self, events: Dict[str, Any], **emit_kwargs):
+        """
+        Emit a group of events bound for the same target as one frame.
+
+        A single event goes out under its own name; several are wrapped in a
+        'batch' envelope ({event: payload}) that the clients unpack and
+        dispatch to their regular handlers in order.
+        """
+        if len(events) == 1:
+            (event, payload), = events.items()
+            self.socketio.emit(event, payload, **emit_kwargs)
+        else:
+            self.socketio.emit('batch', events, **emit_kwargs)
+
+    def flush_pending(self):
+        """
+        Emit everything queued for the admin room or coalesced broadcast now.
+
+        Platform handlers in events.py emit without going through the router;
+        they call this first so queued game events keep their order.
+        """
+        self._drain_admin()
+        self._drain_broadcast()
+
+    def _queue_admin(self, events: Dict[str, Any]):
+        """
+        Queue events for the admin room and schedule a flush.
+
+        Responses arriving within ADMIN_COALESCE_SECONDS of each other reach
+        the admin as a single frame. Events are kept as an ordered list so a
+        repeated event name (e.g. one answer_received per team) is not lost.
+        """
+        with self._admin_lock:
+            self._pending_admin.extend(events.items())
+            if self._admin_flush_scheduled:
+                return
+            self._admin_flush_scheduled = True
+        self.socketio.start_background_task(self._flush_admin)
+
+    def _flush_admin(self):
+        """Emit everything queued for the admin room after the coalesce window."""
+        self.socketio.sleep(self.ADMIN_COALESCE_SECONDS)
+        self._drain_admin()
+
+    def _drain_admin(self):
+        """
+        Emit everything queued for the admin room now.
+
+        Called before any immediate emit that also reaches the admin
+        (broadcasts, replies to an admin sender, state_change, and the
+        platform emits in events.py via flush_pending), so queued events do
+        not arrive after something that happened later.
+        """
+        if not self._pending_admin:
+            return
+        with self._admin_lock:
+            pending = self._pending_admin
+            self._pending_admin = []
+            self._admin_flush_scheduled = False
+
+        if len(pending) == 1:
+            (event, payload), = pending
+            self.socketio.emit(event, payload, room='admin')
+        elif pending:
+            self.socketio.emit('batch', pending, room='admin')
+
+    def _queue_broadcast(self, events: Dict[str, Any]):
+        """
+        Fold events into the pending broadcast and schedule a flush.
+
+        Unlike the admin queue, a repeated event name collapses into one
+        emission: dict payloads are merged key by key, one level deep, so
+        per-team deltas (e.g. timeline_status) accumulate instead of being
+        replaced. Payloads from games are copied, never mutated.
+        """
+        with self._broadcast_lock:
+            pending = self._pending_broadcast
+            for event, payload in events.items():
+                previous = pending.get(event)
+                if isinstance(previous, dict) and isinstance(payload, dict):
+                    merged = dict(previous)
+                    for key, value in payload.items():
+                        old = merged.get(key)
+                        if isinstance(old, dict) and isinstance(value, dict):
+                            value = {**old, **value}
+                        merged[key] = value
+                    payload = merged
+                pending[event] = payload
+            if self._broadcast_flush_scheduled:
+                return
+            self._broadcast_flush_scheduled = True
+        self.socketio.start_background_task(self._flush_broadcast)
+
+    def _flush_broadcast(self):
+        """Emit the folded broadcast events after the coalesce window."""
+        self.socketio.sleep(self.BROADCAST_COALESCE_SECONDS)
+        self._drain_broadcast()
+
+    def _drain_broadcast(self):
+        """
+        Emit the folded broadcast events now.
+
+        Called before immediate broadcasts, state_change and (via
+        flush_pending) the platform emits in events.py, so a queued delta
+        does not land after an event that was produced later.
+        """
+        if not self._pending_broadcast:
+            return
+        with self._broadcast_lock:
+            pending = self._pending_broadcast
+            self._pending_broadcast = {}
+            self._broadcast_flush_scheduled = False
+
+        if pending:
+            self._emit_batch(pending)
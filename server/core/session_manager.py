@@ -5,6 +5,7 @@ This is the 'Console' component that all game cartridges share.
 Handles team registration, player management, scoring, and persistence.
 """
 
+import atexit
 import json
 import os
 import uuid
@@ -13,18 +14,29 @@ import time
 import logging
 import threading
 import shutil
+import sys
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Set
+
+try:
+    import orjson  # Optional: much faster encoding/decoding of scores.json
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+# Exclude confusing characters: 0/O, 1/I/L
+JOIN_CODE_CHARS = 'ABCDEFGHJKMNPQRSTUVWXYZ23456789'
+
+# Backed by os.urandom, so codes can't be predicted from earlier ones
+_join_code_random = random.SystemRandom()
+
+
 def generate_join_code(length: int = 4) -> str:
     """Generate a random alphanumeric join code (uppercase, no confusing chars)."""
-    # Exclude confusing characters: 0/O, 1/I/L
-    chars = 'ABCDEFGHJKMNPQRSTUVWXYZ23456789'
-    return ''.join(random.choice(chars) for _ in range(length))
+    return ''.join(_join_code_random.choices(JOIN_CODE_CHARS, k=length))
 
 
 class SessionManager:
@@ -51,6 +63,7 @@ class SessionManager:
         {'id': 7, 'name': 'Sand', 'hex': '#F4A460'},
         {'id': 8, 'name': 'Seafoam', 'hex': '#98D8C8'},
     ]
+    TEAM_COLORS_BY_ID = {color['id']: color for color in TEAM_COLORS}
 
     # Session TTL: sessions older than this are cleaned up (24 hours default)
     SESSION_TTL_SECONDS = 24 * 60 * 60
@@ -58,30 +71,84 @@ class SessionManager:
     # How often to run cleanup (1 hour)
     CLEANUP_INTERVAL_SECONDS = 60 * 60
 
+    # Max stale sessions removed per lock acquisition during cleanup
+    CLEANUP_BATCH_SIZE = 500
+
+    # Raw input longer than this is rejected before strip() copies it
+    # (names allow 20 characters plus whitespace slack; codes are 4-6)
+    MAX_RAW_NAME_LENGTH = 64
+    MAX_RAW_JOIN_CODE_LENGTH = 16
+
+    # Join code draws per length before moving to a longer code
+    JOIN_CODE_ATTEMPTS = 100
+
+    # How long the writer waits after a change so bursts coalesce into one write
+    SAVE_DEBOUNCE_SECONDS = 0.2
+    # How often an idle writer checks for shutdown
+    WRITER_POLL_SECONDS = 0.5
+    # Pause before retrying after a failed save
+    SAVE_RETRY_SECONDS = 5
+
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.scores_file = self.data_dir / "scores.json"
+        # Compact JSON by default; SCORES_PRETTY=1 writes an indented file for debugging
+        self._pretty_scores = os.environ.get('SCORES_PRETTY') == '1'
 
         # Thread-safe lock for all state mutations
-        # Using RLock so methods can call other methods that also acquire the lock
-        self._lock = threading.RLock()
+        # Plain Lock: no locked section calls back into another locking
+        # method (helpers like _get_players_list expect it already held)
+        self._lock = threading.Lock()
 
         # Core state (no game-specific state)
         self.teams: Dict[str, dict] = {}
-        self.sessions: Dict[str, dict] = {}  # session_id -> {team_id, player_id, last_seen}
+        self.sessions: Dict[str, dict] = {}  # session_id -> {team_id, player_id, last_seen (monotonic)} (in memory only)
         self.join_codes: Dict[str, str] = {}  # join_code -> team_id
+        self._sessions_by_team: Dict[str, set] = {}  # team_id -> session_ids (derived)
+        self._team_names: Dict[str, str] = {}  # lowercased team name -> team_id (derived)
+        self._color_counts: Dict[int, int] = {}  # color id -> teams using it (derived)
+        self._free_colors: Set[int] = set(self.TEAM_COLORS_BY_ID)  # palette ids no team uses (derived)
+
+        # Rendered players list per team (team_id -> [{player_id, name}]).
+        # Derived from teams, never persisted; dropped when a roster changes.
+        self._players_lists: Dict[str, List[dict]] = {}
+        self._player_names: Dict[str, List[str]] = {}  # team_id -> [name], same lifecycle
+        self._player_names_lower: Dict[str, set] = {}  # team_id -> {lowercased name} (derived)
 
         self.current_state: str = "LOBBY"
         self.state_data: Dict[str, Any] = {}
 
-        # Cleanup timer
-        self._cleanup_timer: Optional[threading.Timer] = None
+        # Read-only score/team views handed to broadcasts. Rebuilt under the
+        # lock after every team mutation and swapped in whole, so readers
+        # need no lock and never see a half-updated dict.
+        self._scores_snapshot: Dict[str, int] = {}
+        self._teams_info_snapshot: Dict[str, dict] = {}
+        self._scores_payload: Dict[str, dict] = {'scores': {}, 'teams': {}}
 
         # Load persisted data on startup
         self._load_scores()
-
-        # Start periodic cleanup
-        self._schedule_cleanup()
+        self._refresh_snapshots()
+
+        # Background writer for scores.json. Mutations only set _dirty; the
+        # writer waits out SAVE_DEBOUNCE_SECONDS and persists the latest state.
+        self._dirty = threading.Event()
+        self._stopping = threading.Event()
+        self._write_lock = threading.Lock()  # Serializes writer thread and flush()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name='scores-writer',
+            daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.shutdown)
+
+        # Periodic session cleanup on one long-lived thread (stops with _stopping)
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_loop,
+            name='session-cleanup',
+            daemon=True
+        )
+        self._cleanup_thread.start()
 
         logger.info(f"SessionManager initialized. Loaded {len(self.teams)} teams.")
 
@@ -105,19 +172,30 @@ class SessionManager:
 
         for source_name, file_path in files_to_try:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-
-                self.teams = data.get('teams', {})
-                self.sessions = data.get('sessions', {})
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+                # Sessions are Socket.IO IDs and don't survive a restart, so they
+                # aren't restored (older files may still contain them). Clients
+                # rebind through reassociate_session on reconnect.
+                # Team IDs are interned so every later lookup by the session's
+                # team_id hits the dict key by identity
+                self.teams = {sys.intern(tid): team for tid, team in data.get('teams', {}).items()}
                 self.current_state = data.get('current_state', 'LOBBY')
                 self.state_data = data.get('state_data', {})
 
-                # Rebuild join_codes lookup from teams
+                # Rebuild join_codes and team name lookups from teams
                 self.join_codes = {}
+                self._team_names = {}
+                self._color_counts = {}
                 for team_id, team_data in self.teams.items():
                     if 'join_code' in team_data:
                         self.join_codes[team_data['join_code']] = team_id
+                    self._team_names[team_data['name'].lower()] = team_id
+                    color_id = team_data.get('color', 0)
+                    self._color_counts[color_id] = self._color_counts.get(color_id, 0) + 1
+                self._free_colors = set(self.TEAM_COLORS_BY_ID).difference(self._color_counts)
 
                 if source_name == 'backup':
                     logger.warning(f"Loaded from backup file (main was corrupted)")
@@ -127,30 +205,99 @@ class SessionManager:
                 logger.info(f"Loaded session state: {len(self.teams)} teams, State: {self.current_state}")
                 return  # Success, exit loop
 
-            except (json.JSONDecodeError, IOError) as e:
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
                 logger.error(f"Failed to load {source_name} scores file: {e}")
                 continue  # Try next file
 
         logger.error("All score files corrupted, starting fresh.")
 
-    def _save_scores(self) -> None:
+    def _mark_dirty(self) -> None:
         """
-        Persist game data to JSON file with atomic write and backup.
+        Mark game data as changed so the background writer persists it.
 
-        Uses write-to-temp-then-rename pattern for crash safety:
-        1. Write to temporary file
-        2. If scores.json exists, copy it to scores.json.bak
-        3. Atomically rename temp file to scores.json
+        Cheap enough to call on every mutation: repeated calls within
+        SAVE_DEBOUNCE_SECONDS collapse into a single write of the latest state.
         """
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._dirty.set()
+
+    def _snapshot_scores(self) -> dict:
+        """
+        Copy the persisted game data so it can be encoded outside the lock.
 
-        data = {
-            'teams': self.teams,
-            'sessions': self.sessions,
+        Caller must hold self._lock. Team records and their players dicts are
+        copied because they are updated in place; player entries and
+        state_data are only ever replaced, so they are shared.
+        """
+        return {
+            'teams': {
+                tid: {**team, 'players': dict(team.get('players', {}))}
+                for tid, team in self.teams.items()
+            },
             'current_state': self.current_state,
             'state_data': self.state_data
         }
 
+    def _serialize_scores(self, data: dict) -> bytes:
+        """Serialize a snapshot from _snapshot_scores for writing."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if self._pretty_scores else 0)
+        if self._pretty_scores:
+            return json.dumps(data, indent=2).encode('utf-8')
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def _writer_loop(self) -> None:
+        """Persist changes after each debounce window until shutdown."""
+        while not self._stopping.is_set():
+            # Poll so shutdown can end an idle writer without marking data dirty
+            if not self._dirty.wait(self.WRITER_POLL_SECONDS):
+                continue
+            # Let a burst of mutations settle; shutdown cuts the wait short
+            self._stopping.wait(self.SAVE_DEBOUNCE_SECONDS)
+            try:
+                saved = self.flush()
+            except Exception:
+                # Keep the writer alive; one bad payload must not stop persistence
+                logger.exception("Background save of scores.json failed")
+                saved = False
+            if not saved:
+                # flush() re-marked the data dirty; back off before retrying
+                self._stopping.wait(self.SAVE_RETRY_SECONDS)
+
+    def flush(self) -> bool:
+        """
+        Write any pending changes to scores.json now, blocking until done.
+
+        Returns False if the save failed; the data stays marked dirty so the
+        change is retried rather than dropped.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty.is_set():
+                    return True
+                self._dirty.clear()
+                snapshot = self._snapshot_scores()
+            # Encoding and disk I/O happen without blocking game events
+            try:
+                saved = self._write_scores(self._serialize_scores(snapshot))
+            except Exception:
+                self._dirty.set()
+                raise
+            if not saved:
+                self._dirty.set()
+            return saved
+
+    def _write_scores(self, payload: bytes) -> bool:
+        """
+        Write a serialized payload to scores.json with atomic write and backup.
+        Returns True if scores.json was replaced.
+
+        Uses write-to-temp-then-rename pattern for crash safety:
+        1. Write to temporary file and fsync it
+        2. If scores.json exists, hardlink it as scores.json.bak
+        3. Atomically rename temp file to scores.json
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
         backup_file = self.scores_file.with_suffix('.json.bak')
 
         try:
@@ -161,14 +308,28 @@ class SessionManager:
                 dir=self.data_dir
             )
             try:
-                with os.fdopen(fd, 'w') as f:
-                    json.dump(data, f, indent=2)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    # One fsync per debounced flush, so the rename below can't
+                    # land before the data and leave an empty scores.json
+                    f.flush()
+                    os.fsync(f.fileno())
             except:
                 os.unlink(temp_path)
                 raise
 
-            # Create backup of existing file if it exists
-            if self.scores_file.exists():
+            # Keep the previous file as the backup by hardlinking it; the rename
+            # below only swaps the scores.json entry, so the backup survives
+            try:
+                os.unlink(backup_file)
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(self.scores_file, backup_file)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Filesystem without hardlink support - fall back to a copy
                 try:
                     shutil.copy2(self.scores_file, backup_file)
                 except IOError as e:
@@ -177,6 +338,7 @@ class SessionManager:
             # Atomic rename (on POSIX systems)
             os.replace(temp_path, self.scores_file)
             logger.debug("Session state saved to scores.json")
+            return True
 
         except (IOError, OSError) as e:
             logger.error(f"Failed to save scores.json: {e}")
@@ -187,17 +349,19 @@ class SessionManager:
                     logger.info("Restored scores.json from backup")
                 except IOError:
                     pass
+            return False
 
-    def _schedule_cleanup(self) -> None:
-        """Schedule the next session cleanup."""
-        if self._cleanup_timer:
-            self._cleanup_timer.cancel()
-        self._cleanup_timer = threading.Timer(
-            self.CLEANUP_INTERVAL_SECONDS,
-            self._cleanup_stale_sessions
-        )
-        self._cleanup_timer.daemon = True
-        self._cleanup_timer.start()
+    def shutdown(self) -> None:
+        """Stop the background threads and flush any pending save."""
+        self._stopping.set()  # Ends the writer and cleanup loops
+        if self._writer_thread.is_alive():
+            self._writer_thread.join(timeout=5)
+        self.flush()  # Writes only if something is still dirty
+
+    def _cleanup_loop(self) -> None:
+        """Run session cleanup every CLEANUP_INTERVAL_SECONDS until shutdown."""
+        while not self._stopping.wait(self.CLEANUP_INTERVAL_SECONDS):
+            self._cleanup_stale_sessions()
 
     def _cleanup_stale_sessions(self) -> None:
         """
@@ -206,58 +370,70 @@ class SessionManager:
         This prevents unbounded memory growth from accumulated sessions.
         """
         try:
-            now = time.time()
+            now = time.monotonic()
             stale_count = 0
 
+            def is_stale(session_data: dict) -> bool:
+                return now - session_data['last_seen'] > self.SESSION_TTL_SECONDS
+
+            # Scan a copy so the lock is only held for the copy itself
             with self._lock:
-                # Find stale sessions
-                stale_session_ids = []
-                for session_id, session_data in self.sessions.items():
-                    if isinstance(session_data, dict):
-                        last_seen = session_data.get('last_seen', 0)
-                    else:
-                        # Legacy format - no timestamp, treat as stale
-                        last_seen = 0
-
-                    if now - last_seen > self.SESSION_TTL_SECONDS:
-                        stale_session_ids.append(session_id)
-
-                # Remove stale sessions
-                for session_id in stale_session_ids:
-                    del self.sessions[session_id]
-                    stale_count += 1
-
-                if stale_count > 0:
-                    self._save_scores()
-                    logger.info(f"Cleaned up {stale_count} stale sessions")
+                sessions = list(self.sessions.items())
+            stale_session_ids = [
+                session_id for session_id, session_data in sessions
+                if is_stale(session_data)
+            ]
+
+            # Remove stale sessions in bounded batches, releasing the lock
+            # between them; re-check each one in case it was touched meanwhile
+            batch_size = self.CLEANUP_BATCH_SIZE
+            for start in range(0, len(stale_session_ids), batch_size):
+                with self._lock:
+                    for session_id in stale_session_ids[start:start + batch_size]:
+                        session_data = self.sessions.get(session_id)
+                        if session_data is not None and is_stale(session_data):
+                            self._unbind_session(session_id)
+                            stale_count += 1
+
+            if stale_count > 0:
+                logger.info(f"Cleaned up {stale_count} stale sessions")
 
         except Exception as e:
             logger.error(f"Session cleanup failed: {e}")
-        finally:
-            # Schedule next cleanup
-            self._schedule_cleanup()
 
-    def touch_session(self, session_id: str) -> None:
-        """Update the last_seen timestamp for a session."""
+    def end_session(self, session_id: str) -> None:
+        """
+        Forget a session whose socket disconnected.
+
+        Reconnects get a new session ID and rebind through reassociate_session
+        using the client's stored team/player IDs, so nothing is lost; this
+        keeps _sessions_by_team down to connected sockets.
+        """
         with self._lock:
-            if session_id in self.sessions:
-                session_data = self.sessions[session_id]
-                if isinstance(session_data, dict):
-                    session_data['last_seen'] = time.time()
-                else:
-                    # Migrate legacy format
-                    self.sessions[session_id] = {
-                        'team_id': session_data,
-                        'player_id': None,
-                        'last_seen': time.time()
-                    }
+            self._unbind_session(session_id)
+
+    def touch_session(self, session_id: str) -> None:
+        """
+        Update the last_seen timestamp for a session.
+
+        Called on every game event and heartbeat. last_seen only feeds the TTL
+        cleanup and sessions are never persisted, so this must not mark the
+        state dirty or otherwise touch disk.
+
+        Lock-free: a single dict.get plus one key assignment is atomic under
+        the GIL, and cleanup re-checks last_seen under the lock before
+        removing anything.
+        """
+        session_data = self.sessions.get(session_id)
+        if session_data is not None:
+            session_data['last_seen'] = time.monotonic()
 
     def set_state(self, new_state: str, state_data: dict = None) -> None:
         """Update current game state."""
         with self._lock:
             self.current_state = new_state
             self.state_data = state_data or {}
-            self._save_scores()
+            self._mark_dirty()
 
     def create_team(self, team_name: str, player_name: str, session_id: str) -> dict:
         """
@@ -267,14 +443,16 @@ class SessionManager:
             dict with success, team_id, player_id, team_name, join_code
         """
         # Validate inputs first (no lock needed)
-        team_name = team_name.strip()
+        if len(team_name) <= self.MAX_RAW_NAME_LENGTH:
+            team_name = team_name.strip()
         if not team_name or len(team_name) > 20:
             return {
                 'success': False,
                 'message': 'Team name must be 1-20 characters'
             }
 
-        player_name = player_name.strip()
+        if len(player_name) <= self.MAX_RAW_NAME_LENGTH:
+            player_name = player_name.strip()
         if not player_name or len(player_name) > 20:
             return {
                 'success': False,
@@ -285,10 +463,10 @@ class SessionManager:
             # Check if session already has a team
             if session_id in self.sessions:
                 session_data = self.sessions[session_id]
-                existing_team_id = session_data.get('team_id') if isinstance(session_data, dict) else session_data
+                existing_team_id = session_data['team_id']
                 if existing_team_id in self.teams:
                     team = self.teams[existing_team_id]
-                    player_id = session_data.get('player_id') if isinstance(session_data, dict) else None
+                    player_id = session_data['player_id']
                     return {
                         'success': True,
                         'team_id': existing_team_id,
@@ -301,22 +479,22 @@ class SessionManager:
                     }
 
             # Check for duplicate team name
-            for tid, team_data in self.teams.items():
-                if team_data['name'].lower() == team_name.lower():
-                    return {
-                        'success': False,
-                        'message': 'Team name already taken'
-                    }
+            team_name_lower = team_name.lower()
+            if team_name_lower in self._team_names:
+                return {
+                    'success': False,
+                    'message': 'Team name already taken'
+                }
 
             # Generate unique join code
-            join_code = generate_join_code()
-            while join_code in self.join_codes:
-                join_code = generate_join_code()
+            join_code = self._new_join_code()
 
             # Create new team
-            team_id = str(uuid.uuid4())
+            team_id = sys.intern(str(uuid.uuid4()))
             player_id = str(uuid.uuid4())
             team_color = self._assign_team_color()
+            self._color_counts[team_color] = self._color_counts.get(team_color, 0) + 1
+            self._free_colors.discard(team_color)
 
             self.teams[team_id] = {
                 'name': team_name,
@@ -333,13 +511,12 @@ class SessionManager:
                 }
             }
             self.join_codes[join_code] = team_id
-            self.sessions[session_id] = {
-                'team_id': team_id,
-                'player_id': player_id,
-                'last_seen': time.time()
-            }
+            self._team_names[team_name_lower] = team_id
+            self._bind_session(session_id, team_id, player_id)
 
-            self._save_scores()
+            self._refresh_score_snapshot(team_id)
+            self._refresh_team_info_snapshot(team_id)
+            self._mark_dirty()
 
             logger.info(f"Team created: {team_name} ({team_id}) by {player_name}, code: {join_code}")
 
@@ -355,6 +532,21 @@ class SessionManager:
                 'message': 'Team created successfully'
             }
 
+    def _new_join_code(self) -> str:
+        """
+        Generate a join code that is not in use. Caller must hold self._lock.
+
+        Retries are bounded; if the 4-character space is ever that crowded,
+        codes grow by one character instead of looping indefinitely.
+        """
+        length = 4
+        while True:
+            for _ in range(self.JOIN_CODE_ATTEMPTS):
+                join_code = generate_join_code(length)
+                if join_code not in self.join_codes:
+                    return join_code
+            length += 1
+
     def join_team(self, join_code: str, player_name: str, session_id: str) -> dict:
         """
         Join an existing team via join code.
@@ -363,23 +555,29 @@ class SessionManager:
             dict with success, team_id, player_id, team_name, players list
         """
         # Validate inputs first (no lock needed)
-        player_name = player_name.strip()
+        if len(player_name) <= self.MAX_RAW_NAME_LENGTH:
+            player_name = player_name.strip()
         if not player_name or len(player_name) > 20:
             return {
                 'success': False,
                 'message': 'Player name must be 1-20 characters'
             }
 
+        if len(join_code) > self.MAX_RAW_JOIN_CODE_LENGTH:
+            return {
+                'success': False,
+                'message': 'Invalid join code'
+            }
         join_code = join_code.strip().upper()
 
         with self._lock:
             # Check if session already has a team
             if session_id in self.sessions:
                 session_data = self.sessions[session_id]
-                existing_team_id = session_data.get('team_id') if isinstance(session_data, dict) else session_data
+                existing_team_id = session_data['team_id']
                 if existing_team_id in self.teams:
                     team = self.teams[existing_team_id]
-                    player_id = session_data.get('player_id') if isinstance(session_data, dict) else None
+                    player_id = session_data['player_id']
                     return {
                         'success': True,
                         'team_id': existing_team_id,
@@ -402,12 +600,16 @@ class SessionManager:
             team = self.teams[team_id]
 
             # Check if player name already exists on this team
-            for pid, pdata in team['players'].items():
-                if pdata['name'].lower() == player_name.lower():
-                    return {
-                        'success': False,
-                        'message': 'Player name already taken on this team'
-                    }
+            taken_names = self._player_names_lower.get(team_id)
+            if taken_names is None:
+                taken_names = {p['name'].lower() for p in team['players'].values()}
+                self._player_names_lower[team_id] = taken_names
+            player_name_lower = player_name.lower()
+            if player_name_lower in taken_names:
+                return {
+                    'success': False,
+                    'message': 'Player name already taken on this team'
+                }
 
             # Add player to team
             player_id = str(uuid.uuid4())
@@ -415,13 +617,13 @@ class SessionManager:
                 'name': player_name,
                 'joined_at': time.time()
             }
-            self.sessions[session_id] = {
-                'team_id': team_id,
-                'player_id': player_id,
-                'last_seen': time.time()
-            }
+            taken_names.add(player_name_lower)
+            self._players_lists.pop(team_id, None)
+            self._player_names.pop(team_id, None)
+            self._bind_session(session_id, team_id, player_id)
 
-            self._save_scores()
+            self._refresh_team_info_snapshot(team_id)
+            self._mark_dirty()
 
             logger.info(f"Player {player_name} joined team {team['name']} ({team_id})")
 
@@ -438,29 +640,98 @@ class SessionManager:
             }
 
     def _get_players_list(self, team_id: str) -> List[dict]:
-        """Get list of players for a team."""
+        """
+        Get list of players for a team.
+
+        The list is cached until the team's roster changes, so callers must
+        treat it as read-only.
+        """
+        players_list = self._players_lists.get(team_id)
+        if players_list is not None:
+            return players_list
+
         team = self.teams.get(team_id)
         if not team or 'players' not in team:
             return []
-        return [
+        players_list = [
             {'player_id': pid, 'name': pdata['name']}
             for pid, pdata in team['players'].items()
         ]
+        self._players_lists[team_id] = players_list
+        return players_list
+
+    def _bind_session(self, session_id: str, team_id: str, player_id: Optional[str]) -> None:
+        """Map a session to a player, keeping _sessions_by_team in step. Caller must hold self._lock."""
+        if session_id in self.sessions:
+            self._unbind_session(session_id)
+        self.sessions[session_id] = {
+            'team_id': team_id,
+            'player_id': player_id,
+            'last_seen': time.monotonic()
+        }
+        self._sessions_by_team.setdefault(team_id, set()).add(session_id)
+
+    def _unbind_session(self, session_id: str) -> None:
+        """Drop a session mapping and its index entry. Caller must hold self._lock."""
+        session_data = self.sessions.pop(session_id, None)
+        if session_data is None:
+            return
+        team_id = session_data['team_id']
+        team_sessions = self._sessions_by_team.get(team_id)
+        if team_sessions is not None:
+            team_sessions.discard(session_id)
+            if not team_sessions:
+                del self._sessions_by_team[team_id]
+
+    def _get_player_names(self, team_id: str) -> List[str]:
+        """
+        Get the player names for a team, as shown in get_teams_info.
+
+        Cached like _get_players_list; read-only. Caller must hold self._lock.
+        """
+        names = self._player_names.get(team_id)
+        if names is None:
+            team = self.teams.get(team_id)
+            names = [p['name'] for p in team.get('players', {}).values()] if team else []
+            self._player_names[team_id] = names
+        return names
 
     def get_team_for_session(self, session_id: str) -> Optional[dict]:
         """
         Get session data for a session.
 
         Returns:
-            dict with team_id, player_id or None if not found
+            dict with team_id, player_id or None if not found. This is the
+            live session record, not a copy - callers must not modify it.
+        """
+        return self.sessions.get(session_id)
+
+    def get_session_context(self, session_id: str) -> Optional[tuple]:
+        """
+        Get the event context for a session.
+
+        The tuple is built on first use and cached on the session record.
+        Team and player names never change once created, and every path that
+        rebinds or removes a session replaces the record, so it cannot go stale.
+
+        Returns:
+            (team_id, player_id, team_name, player_name) or None if not found
         """
         session_data = self.sessions.get(session_id)
-        if session_data is None:
+        if not session_data:
             return None
-        # Handle legacy format (just team_id string)
-        if isinstance(session_data, str):
-            return {'team_id': session_data, 'player_id': None}
-        return session_data
+
+        context = session_data.get('context')
+        if context is None:
+            team_id = session_data['team_id']
+            player_id = session_data['player_id']
+            team = self.teams.get(team_id)
+            if not team:
+                return (team_id, player_id, "", "")
+            player = team['players'].get(player_id) if player_id else None
+            context = (team_id, player_id, team['name'], player['name'] if player else "")
+            session_data['context'] = context
+        return context
 
     def reassociate_session(self, session_id: str, team_id: str, player_id: str) -> bool:
         """
@@ -483,14 +754,11 @@ class SessionManager:
             if 'players' not in team or player_id not in team['players']:
                 return False
 
-            # Store the new session mapping
-            self.sessions[session_id] = {
-                'team_id': team_id,
-                'player_id': player_id,
-                'last_seen': time.time()
-            }
+            # Bind the canonical (interned) key, not the string off the wire
+            team_id = sys.intern(team_id)
 
-            self._save_scores()
+            # Store the new session mapping
+            self._bind_session(session_id, team_id, player_id)
 
             player_name = team['players'][player_id].get('name', 'Unknown')
             logger.info(f"Session reassociated: {session_id} -> {player_name} on {team['name']}")
@@ -525,7 +793,8 @@ class SessionManager:
                 return False
 
             self.teams[team_id]['score'] += points
-            self._save_scores()
+            self._refresh_score_snapshot(team_id)
+            self._mark_dirty()
 
             logger.info(f"Added {points} points to {self.teams[team_id]['name']}: {reason}")
             return True
@@ -539,45 +808,93 @@ class SessionManager:
         """
         with self._lock:
             if preserve_teams:
-                for team_id in self.teams:
-                    self.teams[team_id]['score'] = 0
-                    self.teams[team_id]['status'] = 'active'
-                    self.teams[team_id]['eliminated'] = False
+                for team in self.teams.values():
+                    team.update(score=0, status='active', eliminated=False)
             else:
                 self.teams = {}
                 self.sessions = {}
+                self._sessions_by_team = {}
                 self.join_codes = {}
+                self._team_names = {}
+                self._color_counts = {}
+                self._free_colors = set(self.TEAM_COLORS_BY_ID)
+                self._players_lists = {}
+                self._player_names = {}
+                self._player_names_lower = {}
 
-            self._save_scores()
+            self._refresh_snapshots()
+            self._mark_dirty()
 
             logger.info(f"Game reset. preserve_teams={preserve_teams}")
 
-    def get_scores(self) -> Dict[str, int]:
-        """Get current scores for all teams."""
-        return {
+    def _refresh_snapshots(self) -> None:
+        """Rebuild the score and team-info views. Caller must hold self._lock."""
+        self._scores_snapshot = {
             tid: team['score']
             for tid, team in self.teams.items()
         }
+        self._teams_info_snapshot = {
+            tid: self._build_team_info(tid, team)
+            for tid, team in self.teams.items()
+        }
+        self._publish_scores_payload()
 
-    def get_teams_info(self) -> Dict[str, dict]:
-        """Get team info for broadcasting."""
+    def _refresh_score_snapshot(self, team_id: str) -> None:
+        """
+        Update one team's entry in the score view. Caller must hold self._lock.
+
+        The view is replaced rather than edited, since earlier snapshots may
+        still be held by callers.
+        """
+        self._scores_snapshot = {**self._scores_snapshot, team_id: self.teams[team_id]['score']}
+        self._publish_scores_payload()
+
+    def _refresh_team_info_snapshot(self, team_id: str) -> None:
+        """Update one team's entry in the team-info view. Caller must hold self._lock."""
+        self._teams_info_snapshot = {
+            **self._teams_info_snapshot,
+            team_id: self._build_team_info(team_id, self.teams[team_id])
+        }
+        self._publish_scores_payload()
+
+    def _publish_scores_payload(self) -> None:
+        """Pair the current views for score_update. Caller must hold self._lock."""
+        self._scores_payload = {
+            'scores': self._scores_snapshot,
+            'teams': self._teams_info_snapshot
+        }
+
+    def _build_team_info(self, team_id: str, team: dict) -> dict:
+        """Build the broadcast info for one team."""
         return {
-            tid: {
-                'name': team['name'],
-                'status': team['status'],
-                'color': team.get('color', 1),
-                'avatar': team.get('avatar', ''),
-                'players': [p['name'] for p in team.get('players', {}).values()],
-            }
-            for tid, team in self.teams.items()
+            'name': team['name'],
+            'status': team['status'],
+            'color': team.get('color', 1),
+            'avatar': team.get('avatar', ''),
+            'players': self._get_player_names(team_id),
         }
 
+    def get_scores(self) -> Dict[str, int]:
+        """Get current scores for all teams (shared snapshot - do not modify)."""
+        return self._scores_snapshot
+
+    def get_teams_info(self) -> Dict[str, dict]:
+        """Get team info for broadcasting (shared snapshot - do not modify)."""
+        return self._teams_info_snapshot
+
+    def get_scores_payload(self) -> Dict[str, dict]:
+        """
+        Get the score_update payload: {'scores': ..., 'teams': ...}.
+
+        Both views come from the same mutation, unlike separate get_scores()
+        and get_teams_info() calls (shared snapshot - do not modify).
+        """
+        return self._scores_payload
+
     def _assign_team_color(self) -> int:
         """Assign a color to a new team (1-8), cycling through available colors."""
-        used_colors = {team.get('color', 0) for team in self.teams.values()}
-        for color in self.TEAM_COLORS:
-            if color['id'] not in used_colors:
-                return color['id']
+        if self._free_colors:
+            return min(self._free_colors)
         # All colors used, cycle back (use team count mod 8)
         return (len(self.teams) % 8) + 1
 
@@ -586,11 +903,7 @@ class SessionManager:
         team = self.teams.get(team_id)
         if not team:
             return self.TEAM_COLORS[0]
-        color_id = team.get('color', 1)
-        for color in self.TEAM_COLORS:
-            if color['id'] == color_id:
-                return color
-        return self.TEAM_COLORS[0]
+        return self.TEAM_COLORS_BY_ID.get(team.get('color', 1), self.TEAM_COLORS[0])
 
     def kick_team(self, team_id: str) -> bool:
         """Remove a team from the game."""
@@ -606,14 +919,24 @@ class SessionManager:
                 self.join_codes.pop(team['join_code'], None)
 
             del self.teams[team_id]
+            self._team_names.pop(team_name.lower(), None)
+            color_id = team.get('color', 0)
+            if self._color_counts.get(color_id, 0) > 1:
+                self._color_counts[color_id] -= 1
+            else:
+                self._color_counts.pop(color_id, None)
+                if color_id in self.TEAM_COLORS_BY_ID:
+                    self._free_colors.add(color_id)
+            self._players_lists.pop(team_id, None)
+            self._player_names.pop(team_id, None)
+            self._player_names_lower.pop(team_id, None)
 
-            # Remove session mappings (handle both old and new format)
-            self.sessions = {
-                sid: sdata for sid, sdata in self.sessions.items()
-                if (sdata.get('team_id') if isinstance(sdata, dict) else sdata) != team_id
-            }
+            # Remove session mappings
+            for sid in self._sessions_by_team.pop(team_id, ()):
+                self.sessions.pop(sid, None)
 
-            self._save_scores()
+            self._refresh_snapshots()
+            self._mark_dirty()
 
             logger.info(f"Team kicked: {team_name}")
             return True
@@ -625,7 +948,8 @@ class SessionManager:
                 return False
 
             self.teams[team_id]['avatar'] = avatar_id
-            self._save_scores()
+            self._refresh_team_info_snapshot(team_id)
+            self._mark_dirty()
             logger.debug(f"Team {team_id} avatar set to: {avatar_id}")
             return True
 
@@ -638,9 +962,14 @@ class SessionManager:
             self.teams[team_id]['eliminated'] = eliminated
             self.teams[team_id]['status'] = 'eliminated' if eliminated else 'active'
 
-            self._save_scores()
+            self._refresh_team_info_snapshot(team_id)
+            self._mark_dirty()
             return True
 
+    def get_team_session_count(self, team_id: str) -> int:
+        """Count connected sessions bound to a team."""
+        return len(self._sessions_by_team.get(team_id, ()))
+
     def get_remaining_teams(self) -> int:
         """Count non-eliminated teams."""
         return sum(
@@ -652,7 +981,8 @@ class SessionManager:
         """
         Get team/player state for reconnection sync.
 
-        Note: Does not include game state - that comes from EventRouter.
+        Note: Does not include game state - that comes from EventRouter - or
+        scores, which callers send right after as score_update.
         """
         team = self.teams.get(team_id, {})
         player_name = ''
@@ -660,6 +990,10 @@ class SessionManager:
             player_data = team['players'].get(player_id, {})
             player_name = player_data.get('name', '')
 
+        # Lock so a concurrent join can't leave a stale cached list behind
+        with self._lock:
+            players = self._get_players_list(team_id)
+
         return {
             'team_id': team_id,
             'team_name': team.get('name', ''),
@@ -667,6 +1001,5 @@ class SessionManager:
             'player_name': player_name,
             'join_code': team.get('join_code', ''),
             'color': team.get('color', 1),
-            'players': self._get_players_list(team_id),
-            'scores': self.get_scores(),
+            'players': players,
         }
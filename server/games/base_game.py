@@ -5,9 +5,15 @@ All game modules inherit from BaseGame and implement the required methods.
 This provides a clean separation between the platform (Console) and games (Cartridges).
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, NamedTuple
+
+
+# EventResponse fields that merge() combines with a plain dict update
+_MERGE_FIELDS = ('broadcast', 'broadcast_coalesced', 'to_sender', 'to_team',
+                 'to_team_others', 'to_admin', 'error')
 
 
 @dataclass
@@ -20,37 +26,51 @@ class EventResponse:
 
     Attributes:
         broadcast: Events to emit to all connected clients
+        broadcast_coalesced: Broadcast events that may be folded with the same
+            event from other responses in a short window; later payloads
+            update earlier ones key by key (nested dicts are merged)
         to_sender: Events to emit only to the sender
         to_team: Events to emit to the sender's team room
         to_admin: Events to emit to the admin room
-        to_specific_team: Events to emit to a specific team (team_id -> events)
+        to_specific_team: Events to emit to a specific team (team_id -> events);
+            a defaultdict, so handlers can assign to_specific_team[tid][event]
         error: Error response to send to sender
     """
     broadcast: Dict[str, Any] = field(default_factory=dict)
+    broadcast_coalesced: Dict[str, Any] = field(default_factory=dict)
     to_sender: Dict[str, Any] = field(default_factory=dict)
     to_team: Dict[str, Any] = field(default_factory=dict)
     to_team_others: Dict[str, Any] = field(default_factory=dict)
     to_admin: Dict[str, Any] = field(default_factory=dict)
-    to_specific_team: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    to_specific_team: Dict[str, Dict[str, Any]] = field(default_factory=lambda: defaultdict(dict))
     error: Dict[str, Any] = field(default_factory=dict)
 
+    def __bool__(self) -> bool:
+        """True if there is anything to emit, so empty responses skip routing."""
+        return bool(
+            self.broadcast or self.broadcast_coalesced or self.to_sender or
+            self.to_team or self.to_team_others or self.to_admin or
+            self.to_specific_team or self.error
+        )
+
     def merge(self, other: 'EventResponse') -> 'EventResponse':
         """Merge another EventResponse into this one."""
-        for key in ['broadcast', 'to_sender', 'to_team', 'to_team_others', 'to_admin', 'error']:
-            getattr(self, key).update(getattr(other, key))
+        for key in _MERGE_FIELDS:
+            events = getattr(other, key)
+            if events:
+                getattr(self, key).update(events)
         for team_id, events in other.to_specific_team.items():
-            if team_id not in self.to_specific_team:
-                self.to_specific_team[team_id] = {}
             self.to_specific_team[team_id].update(events)
         return self
 
 
-@dataclass
-class EventContext:
+class EventContext(NamedTuple):
     """
     Context passed to event handlers.
 
     Contains all information about the sender and their session.
+    Built once per incoming event, so it is a NamedTuple: no per-instance
+    __dict__, and it stays read-only for the handlers.
 
     Attributes:
         session_id: The Socket.IO session ID
@@ -59,6 +79,8 @@ class EventContext:
         player_name: The sender's player name
         team_name: The sender's team name
         is_admin: Whether the sender is authenticated as admin
+        claimed_team_id: Team ID named in the payload by a sender with no
+            bound session. Unverified: routing never targets rooms with it.
     """
     session_id: str
     team_id: Optional[str] = None
@@ -66,13 +88,19 @@ class EventContext:
     player_name: str = ''
     team_name: str = ''
     is_admin: bool = False
+    claimed_team_id: Optional[str] = None
+
+    @property
+    def acting_team_id(self) -> Optional[str]:
+        """The bound team, else the claimed one (submit/press/vote handlers only)."""
+        return self.team_id or self.claimed_team_id
 
 
 class BaseGame(ABC):
     """
     Abstract base class for all game cartridges.
 
-    Games inherit from this class and implement:
+    Games inherit from this class and override as needed:
     - on_enter(): Called when transitioning TO this game
     - on_exit(): Called when transitioning AWAY from this game
     - Event handlers mapped in EVENTS and ADMIN_EVENTS dicts
@@ -82,6 +110,7 @@ class BaseGame(ABC):
         GAME_NAME: Human-readable name (e.g., 'Google is Down')
         EVENTS: Mapping of event_name -> handler_method_name for player events
         ADMIN_EVENTS: Mapping of event_name -> handler_method_name for admin events
+        HANDLED_EVENTS: Set of all routed event names (derived, do not set)
     """
 
     GAME_ID: str = ""
@@ -96,6 +125,27 @@ class BaseGame(ABC):
         'music_previous': 'handle_music_previous',
     }
 
+    # Every event name this game routes, precomputed per subclass
+    HANDLED_EVENTS: frozenset = frozenset(GLOBAL_ADMIN_EVENTS)
+
+    # event_name -> unbound handler function across all three maps, resolved
+    # per subclass. Player events take priority over admin events, which take
+    # priority over global admin events.
+    _EVENT_HANDLERS: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.HANDLED_EVENTS = frozenset(cls.EVENTS).union(cls.ADMIN_EVENTS, cls.GLOBAL_ADMIN_EVENTS)
+
+        dispatch = {**cls.GLOBAL_ADMIN_EVENTS, **cls.ADMIN_EVENTS, **cls.EVENTS}
+        missing = sorted(name for name in set(dispatch.values()) if not hasattr(cls, name))
+        if missing:
+            raise TypeError(f"{cls.__name__} maps events to undefined handlers: {', '.join(missing)}")
+        cls._EVENT_HANDLERS = {
+            event_name: getattr(cls, handler_name)
+            for event_name, handler_name in dispatch.items()
+        }
+
     def __init__(self, session_manager: 'SessionManager'):
         """
         Initialize the game with access to the session manager.
@@ -105,13 +155,18 @@ class BaseGame(ABC):
         """
         self.session_manager = session_manager
         self._state: Dict[str, Any] = {}
+        # Bound handlers, so dispatch is a single dict lookup
+        self._handlers: Dict[str, Callable[[Dict[str, Any], EventContext], EventResponse]] = {
+            event_name: handler.__get__(self, type(self))
+            for event_name, handler in self._EVENT_HANDLERS.items()
+        }
 
-    @abstractmethod
     def on_enter(self, state_data: Dict[str, Any]) -> EventResponse:
         """
         Called when the game state transitions TO this game.
 
-        Use this to initialize game-specific state from the provided state_data.
+        Override this to initialize game-specific state from the provided
+        state_data. Default implementation adopts state_data as the state.
 
         Args:
             state_data: Data passed from admin when setting state
@@ -119,19 +174,19 @@ class BaseGame(ABC):
         Returns:
             EventResponse with any events to emit on entry
         """
-        pass
+        self._state = state_data
+        return EventResponse()
 
-    @abstractmethod
     def on_exit(self) -> EventResponse:
         """
         Called when the game state transitions AWAY from this game.
 
-        Use this to clean up game-specific state.
+        Override this to clean up game-specific state. Default does nothing.
 
         Returns:
             EventResponse with any events to emit on exit
         """
-        pass
+        return EventResponse()
 
     def get_state_data(self) -> Dict[str, Any]:
         """
@@ -147,12 +202,13 @@ class BaseGame(ABC):
         Get state data safe to send to clients.
 
         Override this to strip sensitive information like answers.
-        Default implementation returns the same as get_state_data().
+        Default implementation returns the internal state itself, uncopied,
+        since callers only serialize it - do not modify the result.
 
         Returns:
             Sanitized state dict
         """
-        return self.get_state_data()
+        return self._state
 
     def handle_event(self, event_name: str, data: Dict[str, Any],
                      context: EventContext) -> EventResponse:
@@ -169,15 +225,8 @@ class BaseGame(ABC):
         Returns:
             EventResponse indicating what to emit
         """
-        # Check player events, then admin events, then global admin events
-        handler_name = (
-            self.EVENTS.get(event_name) or
-            self.ADMIN_EVENTS.get(event_name) or
-            self.GLOBAL_ADMIN_EVENTS.get(event_name)
-        )
-
-        if handler_name and hasattr(self, handler_name):
-            handler = getattr(self, handler_name)
+        handler = self._handlers.get(event_name)
+        if handler is not None:
             return handler(data, context)
 
         return EventResponse(
@@ -20,7 +20,7 @@ class BuzzerGame(BaseGame):
             'round_id': state_data.get('round_id'),
             'audio_hint': state_data.get('audio_hint', ''),
             'locked_by': None, # {team_id, team_name, player_id, player_name}
-            'frozen_teams': {} # team_id -> expires_at (timestamp)
+            'frozen_teams': {} # team_id -> expires_at (time.monotonic())
         }
         return EventResponse()
     
@@ -30,7 +30,7 @@ class BuzzerGame(BaseGame):
     def handle_press_buzzer(self, data, context: EventContext) -> EventResponse:
         response = EventResponse()
         
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         if not team_id:
             return response
             
@@ -75,17 +75,12 @@ class BuzzerGame(BaseGame):
         
         if correct and points:
              self.session_manager.add_points(team_id, points, 'Buzzer correct answer')
-             response.broadcast['score_update'] = {
-                'scores': self.session_manager.get_scores(),
-                'teams': self.session_manager.get_teams_info()
-            }
+             response.broadcast['score_update'] = self.session_manager.get_scores_payload()
         
         freeze_seconds = 0
         if not correct and team_id:
              freeze_seconds = 10
              self._freeze_team(team_id, freeze_seconds)
-             if team_id not in response.to_specific_team:
-                response.to_specific_team[team_id] = {}
              response.to_specific_team[team_id]['buzzer_lockout'] = {
                 'freeze_seconds': freeze_seconds,
                 'message': f'Frozen for {freeze_seconds} seconds'
@@ -136,13 +131,15 @@ class BuzzerGame(BaseGame):
         return response
 
     def _freeze_team(self, team_id, duration):
-        self._state['frozen_teams'][team_id] = time.time() + duration
+        self._state['frozen_teams'][team_id] = time.monotonic() + duration
 
     def _is_team_frozen(self, team_id):
-        if team_id not in self._state['frozen_teams']:
+        frozen_teams = self._state['frozen_teams']
+        expires_at = frozen_teams.get(team_id)
+        if expires_at is None:
             return False
-        if time.time() >= self._state['frozen_teams'][team_id]:
-            del self._state['frozen_teams'][team_id]
+        if time.monotonic() >= expires_at:
+            del frozen_teams[team_id]
             return False
         return True
 
@@ -2,7 +2,7 @@
 Game Registry for managing game cartridges.
 """
 import logging
-from typing import Dict, Type, Optional
+from typing import Dict, Set, Type, Optional
 from .base_game import BaseGame
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,7 @@ class GameRegistry:
         self.session_manager = session_manager
         self._games: Dict[str, BaseGame] = {}
         self._event_map: Dict[str, str] = {}  # event_name -> game_id
+        self._admin_events: Set[str] = set()
 
     def register(self, game_class: Type[BaseGame]):
         """
@@ -33,6 +34,7 @@ class GameRegistry:
             if event in self._event_map:
                  logger.warning(f"Event '{event}' collision: {self._event_map[event]} vs {game_id}. Last one wins.")
             self._event_map[event] = game_id
+        self._admin_events.update(game_instance.ADMIN_EVENTS, game_instance.GLOBAL_ADMIN_EVENTS)
 
     def get_game(self, game_id: str) -> Optional[BaseGame]:
         """Get a game instance by ID."""
@@ -45,6 +47,10 @@ class GameRegistry:
             return self._games.get(game_id)
         return None
 
+    def is_admin_event(self, event_name: str) -> bool:
+        """Check whether an event is an admin event in any registered game."""
+        return event_name in self._admin_events
+
     def get_all_events(self) -> Dict[str, str]:
         """Get mapping of all registered events to their game IDs."""
         return self._event_map.copy()
@@ -8,13 +8,6 @@ class MinesweeperGame(BaseGame):
         'toggle_elimination': 'handle_toggle_elimination'
     }
 
-    def on_enter(self, state_data):
-        self._state = state_data
-        return EventResponse()
-    
-    def on_exit(self):
-        return EventResponse()
-
     def handle_toggle_elimination(self, data, context: EventContext) -> EventResponse:
         team_id = data.get('team_id')
         eliminated = data.get('eliminated', True)
@@ -37,8 +30,6 @@ class MinesweeperGame(BaseGame):
             
             # Notify team
             if eliminated:
-                if team_id not in response.to_specific_team:
-                    response.to_specific_team[team_id] = {}
                 response.to_specific_team[team_id]['eliminated'] = {'message': 'SYSTEM DELETED'}
                 
         return response
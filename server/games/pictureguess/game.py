@@ -28,7 +28,7 @@ class PictureGuessGame(BaseGame):
         return EventResponse()
 
     def handle_submit_guess(self, data, context: EventContext) -> EventResponse:
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         picture_id = data.get('picture_id')
         guess_text = data.get('guess_text', '')
         
@@ -62,8 +62,6 @@ class PictureGuessGame(BaseGame):
         }
         
         # Notify team
-        if team_id not in response.to_specific_team:
-            response.to_specific_team[team_id] = {}
         response.to_specific_team[team_id]['picture_guess_submitted'] = {
             'player_id': context.player_id,
             'player_name': context.player_name,
@@ -82,7 +80,8 @@ class PictureGuessGame(BaseGame):
         response = EventResponse()
         text = data.get('text', '')
         
-        if context.team_id:
+        # Skip the fan-out when no teammate session could receive it
+        if context.team_id and self.session_manager.get_team_session_count(context.team_id) > 1:
              response.to_team_others['picture_guess_sync'] = {
                 'text': text,
                 'from_player_id': context.player_id,
@@ -109,8 +108,6 @@ class PictureGuessGame(BaseGame):
         self._state['graded_teams'].add(team_id)
 
         # Notify team of result
-        if team_id not in response.to_specific_team:
-            response.to_specific_team[team_id] = {}
         response.to_specific_team[team_id]['picture_guess_result'] = {
             'correct': correct,
             'points_awarded': points if correct else 0
@@ -125,10 +122,7 @@ class PictureGuessGame(BaseGame):
 
         if correct and points:
             self.session_manager.add_points(team_id, points, 'Picture guess correct')
-            response.broadcast['score_update'] = {
-                'scores': self.session_manager.get_scores(),
-                'teams': self.session_manager.get_teams_info()
-            }
+            response.broadcast['score_update'] = self.session_manager.get_scores_payload()
 
         return response
 
@@ -175,9 +169,9 @@ class PictureGuessGame(BaseGame):
         return response
 
     def get_sanitized_state_data(self) -> dict:
-        state = self._state.copy()
-        if 'answers' in state:
-            del state['answers']
-        if 'graded_teams' in state:
-            del state['graded_teams']
-        return state
+        # Whitelist rather than copy-and-delete, so answers are never copied
+        return {
+            'picture_id': self._state.get('picture_id'),
+            'image_url': self._state.get('image_url'),
+            'hint': self._state.get('hint')
+        }
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from ..base_game import BaseGame, EventResponse, EventContext
 
 class PriceGuessGame(BaseGame):
@@ -13,6 +14,10 @@ class PriceGuessGame(BaseGame):
         'show_price_product': 'handle_show_product'
     }
 
+    # Tiered points: 1st=100, 2nd=50, 3rd=25, 4th=10
+    POINT_TIERS = (100, 50, 25, 10)
+    RANK_REASONS = tuple(f'Price guess #{rank}' for rank in range(1, len(POINT_TIERS) + 1))
+
     def on_enter(self, state_data):
         self._state = {
             'product_id': state_data.get('product_id'),
@@ -27,7 +32,7 @@ class PriceGuessGame(BaseGame):
         return EventResponse()
 
     def handle_submit_guess(self, data, context: EventContext) -> EventResponse:
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         product_id = data.get('product_id')
         guess_amount = data.get('guess_amount')
 
@@ -71,8 +76,6 @@ class PriceGuessGame(BaseGame):
         }
 
         # Notify team
-        if team_id not in response.to_specific_team:
-            response.to_specific_team[team_id] = {}
         response.to_specific_team[team_id]['price_guess_submitted'] = {
             'player_id': context.player_id,
             'player_name': context.player_name,
@@ -91,7 +94,8 @@ class PriceGuessGame(BaseGame):
         response = EventResponse()
         text = data.get('text', '')
 
-        if context.team_id:
+        # Skip the fan-out when no teammate session could receive it
+        if context.team_id and self.session_manager.get_team_session_count(context.team_id) > 1:
             response.to_team_others['price_guess_sync'] = {
                 'text': text,
                 'from_player_id': context.player_id,
@@ -103,8 +107,7 @@ class PriceGuessGame(BaseGame):
         product_id = data.get('product_id')
         actual_price = data.get('actual_price')
 
-        # Tiered points: 1st=100, 2nd=50, 3rd=25, 4th=10
-        point_tiers = [100, 50, 25, 10]
+        point_tiers = self.POINT_TIERS
 
         response = EventResponse()
 
@@ -141,7 +144,7 @@ class PriceGuessGame(BaseGame):
                 valid_guesses.append(guess_info)
 
         # Sort valid guesses by closeness (smallest difference first)
-        valid_guesses.sort(key=lambda x: x['difference'])
+        valid_guesses.sort(key=itemgetter('difference'))
 
         # Award tiered points to top 4 valid guesses
         winner_team_id = None
@@ -151,7 +154,7 @@ class PriceGuessGame(BaseGame):
                 points = point_tiers[i]
                 guess['points_awarded'] = points
                 guess['rank'] = i + 1
-                self.session_manager.add_points(guess['team_id'], points, f'Price guess #{i+1}')
+                self.session_manager.add_points(guess['team_id'], points, self.RANK_REASONS[i])
                 total_points_awarded += points
                 if i == 0:
                     guess['status'] = 'winner'
@@ -160,14 +163,11 @@ class PriceGuessGame(BaseGame):
                 guess['points_awarded'] = 0
                 guess['rank'] = i + 1
 
-        # Sort bust guesses by how much over
-        bust_guesses.sort(key=lambda x: x['guess_amount'])
-
-        # Combine all guesses sorted by amount (lowest to highest)
-        all_guesses = sorted(
-            valid_guesses + bust_guesses,
-            key=lambda x: x['guess_amount']
-        )
+        # Combine all guesses sorted by amount (lowest to highest). Every valid
+        # guess is at or under the price and every bust is over it, so the two
+        # sorted lists just concatenate instead of being re-sorted together.
+        bust_guesses.sort(key=itemgetter('guess_amount'))
+        all_guesses = sorted(valid_guesses, key=itemgetter('guess_amount')) + bust_guesses
 
         response.broadcast['price_revealed'] = {
             'product_id': product_id,
@@ -179,10 +179,7 @@ class PriceGuessGame(BaseGame):
 
         # Send score update if any points were awarded
         if total_points_awarded > 0:
-            response.broadcast['score_update'] = {
-                'scores': self.session_manager.get_scores(),
-                'teams': self.session_manager.get_teams_info()
-            }
+            response.broadcast['score_update'] = self.session_manager.get_scores_payload()
 
         # Clear guesses for next round
         self._state['guesses'] = {}
@@ -203,9 +200,9 @@ class PriceGuessGame(BaseGame):
         return response
 
     def get_sanitized_state_data(self) -> dict:
-        state = self._state.copy()
-        if 'guesses' in state:
-            del state['guesses']
-        if 'actual_price' in state:
-            del state['actual_price']
-        return state
+        # Whitelist rather than copy-and-delete, so guesses are never copied
+        return {
+            'product_id': self._state.get('product_id'),
+            'image_url': self._state.get('image_url'),
+            'hint': self._state.get('hint')
+        }
@@ -6,6 +6,8 @@ of their members align with the overall game majority.
 
 from ..base_game import BaseGame, EventResponse, EventContext
 
+VALID_VOTES = ('A', 'B')  # A tuple, so unhashable junk still fails the membership test cleanly
+
 
 class SurvivalGame(BaseGame):
     GAME_ID = "SURVIVAL"
@@ -28,6 +30,8 @@ class SurvivalGame(BaseGame):
             'option_a': state_data.get('option_a', 'YES'),
             'option_b': state_data.get('option_b', 'NO'),
             'player_votes': {},  # player_id -> 'A' or 'B'
+            'player_teams': {},  # player_id -> team_id, for each voter
+            'vote_counts': {'A': 0, 'B': 0},  # tallies of player_votes, kept in step
             'revealed': False,
         }
         return EventResponse()
@@ -38,11 +42,16 @@ class SurvivalGame(BaseGame):
     def handle_vote(self, data, context: EventContext) -> EventResponse:
         """Handle an individual player's vote submission."""
         player_id = context.player_id
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         vote = data.get('vote')  # 'A' or 'B'
 
         response = EventResponse()
 
+        # Cheapest check first, so junk votes never reach the team lookup
+        if vote not in VALID_VOTES:
+            response.error = {'code': 'INVALID_VOTE', 'message': 'Vote must be A or B'}
+            return response
+
         if not player_id:
             response.error = {'code': 'NO_PLAYER', 'message': 'Player required'}
             return response
@@ -51,24 +60,24 @@ class SurvivalGame(BaseGame):
             response.error = {'code': 'NO_TEAM', 'message': 'Team required'}
             return response
 
-        if vote not in ('A', 'B'):
-            response.error = {'code': 'INVALID_VOTE', 'message': 'Vote must be A or B'}
-            return response
-
         team = self.session_manager.get_team(team_id)
         if not team:
             response.error = {'code': 'INVALID_TEAM', 'message': 'Team not found'}
             return response
 
-        # Store individual player vote
-        self._state['player_votes'][player_id] = vote
+        # Store individual player vote, moving it between tallies on a change
+        previous_vote = self._state['player_votes'].get(player_id)
+        if previous_vote != vote:
+            counts = self._state['vote_counts']
+            if previous_vote:
+                counts[previous_vote] -= 1
+            counts[vote] += 1
+            self._state['player_votes'][player_id] = vote
+            self._state['player_teams'][player_id] = team_id
 
         # Count total votes
         vote_counts = self._get_vote_counts()
 
-        # Count how many from this team have voted
-        team_vote_count = self._get_team_vote_count(team_id)
-
         # Notify admin of vote
         response.to_admin['survival_vote_received'] = {
             'team_id': team_id,
@@ -116,13 +125,20 @@ class SurvivalGame(BaseGame):
             # Tie - no points awarded
             game_majority = None
 
+        # Tally each team's votes in one pass: team_id -> [votes_a, votes_b]
+        team_tallies = {}
+        player_teams = self._state['player_teams']
+        for player_id, vote in player_votes.items():
+            tally = team_tallies.setdefault(player_teams[player_id], [0, 0])
+            tally[0 if vote == 'A' else 1] += 1
+
         # Calculate team results
         teams_awarded = []
         teams_not_awarded = []
 
         for team_id, team in self.session_manager.teams.items():
-            team_votes = self._get_team_votes(team_id)
-            if not team_votes:
+            tally = team_tallies.get(team_id)
+            if not tally:
                 # Team didn't vote at all
                 teams_not_awarded.append({
                     'team_id': team_id,
@@ -134,9 +150,7 @@ class SurvivalGame(BaseGame):
                 })
                 continue
 
-            # Count team's votes
-            team_a = sum(1 for v in team_votes.values() if v == 'A')
-            team_b = sum(1 for v in team_votes.values() if v == 'B')
+            team_a, team_b = tally
 
             # Determine team's majority vote
             if team_a > team_b:
@@ -199,6 +213,8 @@ class SurvivalGame(BaseGame):
 
         # Clear votes for new round
         self._state['player_votes'] = {}
+        self._state['player_teams'] = {}
+        self._state['vote_counts'] = {'A': 0, 'B': 0}
         self._state['revealed'] = False
 
         # Update question if provided
@@ -222,25 +238,7 @@ class SurvivalGame(BaseGame):
 
     def _get_vote_counts(self) -> dict:
         """Get current vote counts across all players."""
-        count_a = sum(1 for v in self._state['player_votes'].values() if v == 'A')
-        count_b = sum(1 for v in self._state['player_votes'].values() if v == 'B')
-        return {'A': count_a, 'B': count_b}
-
-    def _get_team_vote_count(self, team_id: str) -> int:
-        """Get count of players from a team who have voted."""
-        team = self.session_manager.get_team(team_id)
-        if not team:
-            return 0
-        team_player_ids = set(team.get('players', {}).keys())
-        return sum(1 for pid in self._state['player_votes'] if pid in team_player_ids)
-
-    def _get_team_votes(self, team_id: str) -> dict:
-        """Get all votes from players on a specific team."""
-        team = self.session_manager.get_team(team_id)
-        if not team:
-            return {}
-        team_player_ids = set(team.get('players', {}).keys())
-        return {pid: vote for pid, vote in self._state['player_votes'].items() if pid in team_player_ids}
+        return dict(self._state['vote_counts'])
 
     def get_sanitized_state_data(self) -> dict:
         """Return state data safe for clients."""
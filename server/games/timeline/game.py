@@ -17,13 +17,18 @@ class TimelineGame(BaseGame):
         'complete_timeline': 'handle_complete_timeline'
     }
 
+    POINTS_TABLE = (100, 75, 50, 25)  # Points by finish position (last entry repeats)
+    POINTS_LAST_INDEX = len(POINTS_TABLE) - 1
+    PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)\s*$')  # Trailing "(1969)" hints on items
+
     def on_enter(self, state_data):
         self._state = {
             'puzzle_id': state_data.get('puzzle_id'),
-            'correct_order': state_data.get('correct_order', []),
+            'correct_order': tuple(state_data.get('correct_order', ())),
             'winners': [],
+            'winners_pos': {}, # team_id -> finish position (1-based)
             'submissions': {}, # team_id -> {order, player_id, player_name, timestamp}
-            'statuses': {tid: 'thinking' for tid in self.session_manager.teams.keys()},
+            'statuses': dict.fromkeys(self.session_manager.teams, 'thinking'),
             'items': state_data.get('items', []) # Needed for reveal
         }
         return EventResponse()
@@ -32,7 +37,7 @@ class TimelineGame(BaseGame):
         return EventResponse()
 
     def handle_submit_timeline(self, data, context: EventContext) -> EventResponse:
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         puzzle_id = data.get('puzzle_id', 0)
         submitted_order = data.get('order', [])
         
@@ -48,47 +53,58 @@ class TimelineGame(BaseGame):
              return response
 
         # Check if team already won
-        if team_id in self._state['winners']:
-            if team_id not in response.to_specific_team:
-                response.to_specific_team[team_id] = {}
+        previous_position = self._state['winners_pos'].get(team_id)
+        if previous_position is not None:
             response.to_specific_team[team_id]['timeline_result'] = {
                 'correct': True,
                 'points_awarded': 0,
-                'finish_position': self._state['winners'].index(team_id) + 1,
+                'finish_position': previous_position,
                 'message': 'Already submitted correct answer',
                 'player_id': context.player_id,
                 'player_name': context.player_name
             }
             return response
 
-        # Store submission
-        self._state['submissions'][team_id] = {
+        submissions = self._state['submissions']
+
+        # The same player resending the same order (double-click, reconnect)
+        # gets the stored result again; skip re-validation and the
+        # admin/broadcast fan-out. A teammate's identical submission is new.
+        previous = submissions.get(team_id)
+        if (previous is not None and previous['player_id'] == context.player_id
+                and previous['order'] == submitted_order):
+            response.to_specific_team[team_id]['timeline_result'] = previous['result']
+            return response
+
+        # Store submission, moving re-submissions to the end so insertion
+        # order stays chronological
+        submissions.pop(team_id, None)
+        submissions[team_id] = {
             'order': submitted_order,
             'player_id': context.player_id,
             'player_name': context.player_name,
-            'timestamp': time.time()
+            'timestamp': time.time_ns() // 1_000_000  # ms since epoch, as an int
         }
 
         # Validate
         correct_order = self._state['correct_order']
-        # Ensure comparison is valid (handle types if needed, JSON lists are usually fine)
-        is_correct = submitted_order == correct_order
+        # Cheap length check first; the stored order is a tuple so compare as one
+        is_correct = (isinstance(submitted_order, list)
+                      and len(submitted_order) == len(correct_order)
+                      and tuple(submitted_order) == correct_order)
 
         if is_correct:
             self._state['winners'].append(team_id)
             finish_position = len(self._state['winners'])
+            self._state['winners_pos'][team_id] = finish_position
             
-            points_table = [100, 75, 50, 25]
-            points = points_table[min(finish_position - 1, len(points_table) - 1)]
+            points = self.POINTS_TABLE[min(finish_position - 1, self.POINTS_LAST_INDEX)]
             
             self.session_manager.add_points(team_id, points, f'Timeline correct - position {finish_position}')
             self._state['statuses'][team_id] = 'winner'
             
             # Result to team
-            if team_id not in response.to_specific_team:
-                response.to_specific_team[team_id] = {}
-                
-            response.to_specific_team[team_id]['timeline_result'] = {
+            result = {
                 'correct': True,
                 'points_awarded': points,
                 'finish_position': finish_position,
@@ -98,18 +114,12 @@ class TimelineGame(BaseGame):
             }
             
             # Score update broadcast
-            response.broadcast['score_update'] = {
-                'scores': self.session_manager.get_scores(),
-                'teams': self.session_manager.get_teams_info()
-            }
+            response.broadcast['score_update'] = self.session_manager.get_scores_payload()
             
         else:
             self._state['statuses'][team_id] = 'failed'
-            
-            if team_id not in response.to_specific_team:
-                response.to_specific_team[team_id] = {}
-                
-            response.to_specific_team[team_id]['timeline_result'] = {
+
+            result = {
                 'correct': False,
                 'attempt_number': 1,
                 'message': 'Incorrect!',
@@ -117,6 +127,9 @@ class TimelineGame(BaseGame):
                 'player_name': context.player_name
             }
 
+        response.to_specific_team[team_id]['timeline_result'] = result
+        submissions[team_id]['result'] = result  # Replayed to a resend
+
         # Notify admin
         response.to_admin['timeline_submission'] = {
             'team_id': team_id,
@@ -127,9 +140,11 @@ class TimelineGame(BaseGame):
             'status': self._state['statuses'][team_id]
         }
         
-        # Broadcast status update
-        response.broadcast['timeline_status'] = {
-            'team_statuses': self._state['statuses']
+        # Broadcast only the changed status; clients hold the full map from
+        # the state snapshot. Coalesced so a burst of submissions goes out as
+        # one merged delta
+        response.broadcast_coalesced['timeline_status'] = {
+            'team_statuses': {team_id: self._state['statuses'][team_id]}
         }
 
         return response
@@ -152,9 +167,9 @@ class TimelineGame(BaseGame):
         
         winner_team_id = self._state['winners'][0] if self._state['winners'] else None
         
-        # Get submissions formatted for TV
+        # Get submissions formatted for TV, newest first
         team_submissions = []
-        for tid, sub in self._state['submissions'].items():
+        for tid, sub in reversed(list(self._state['submissions'].items())):
             team = self.session_manager.get_team(tid)
             if team:
                 team_submissions.append({
@@ -166,7 +181,6 @@ class TimelineGame(BaseGame):
                     'timestamp': sub.get('timestamp', 0),
                     'status': self._state['statuses'].get(tid, 'thinking')
                 })
-        team_submissions.sort(key=lambda x: x['timestamp'], reverse=True)
         
         response = EventResponse()
         response.broadcast['timeline_complete'] = {
@@ -179,19 +193,10 @@ class TimelineGame(BaseGame):
         return response
 
     def get_sanitized_state_data(self) -> dict:
-        def _strip_parenthetical(text: str) -> str:
-            return re.sub(r'\s*\([^)]*\)\s*$', '', text).strip()
-            
-        state = self._state.copy()
-        if 'items' in state:
-            state['items'] = [_strip_parenthetical(item) for item in state['items']]
-        if 'correct_order' in state:
-             del state['correct_order']
-             
-        # Also clean up internal bookkeeping
-        if 'submissions' in state:
-             del state['submissions']
-        if 'winners' in state:
-             del state['winners']
-             
-        return state
+        # Whitelist rather than copy-and-delete; answers and bookkeeping stay out
+        strip = self.PARENTHETICAL_RE.sub
+        return {
+            'puzzle_id': self._state.get('puzzle_id'),
+            'statuses': self._state.get('statuses', {}),
+            'items': [strip('', item).strip() for item in self._state.get('items', [])]
+        }
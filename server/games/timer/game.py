@@ -1,3 +1,4 @@
+import math
 import time
 from ..base_game import BaseGame, EventResponse, EventContext
 
@@ -15,8 +16,7 @@ class TimerGame(BaseGame):
         self._state = {
             'total_seconds': duration,
             'remaining_seconds': duration,
-            'duration_seconds': duration,
-            'start_time': 0,
+            'deadline': 0, # time.monotonic() at which a running timer hits zero
             'paused': False,
             'message': state_data.get('message', '')
         }
@@ -65,34 +65,39 @@ class TimerGame(BaseGame):
         return response
 
     def _start_timer(self, duration, message):
-        self._state['total_seconds'] = duration
-        self._state['remaining_seconds'] = duration
-        self._state['start_time'] = time.time()
-        self._state['paused'] = False
-        self._state['message'] = message
+        s = self._state
+        s['total_seconds'] = duration
+        s['remaining_seconds'] = duration
+        s['deadline'] = time.monotonic() + duration
+        s['paused'] = False
+        s['message'] = message
 
     def _pause_timer(self):
-        if not self._state.get('paused'):
-            elapsed = time.time() - self._state.get('start_time', 0)
-            self._state['remaining_seconds'] = max(0, self._state.get('remaining_seconds', 0) - int(elapsed))
-            self._state['paused'] = True
-        return self._state['remaining_seconds']
+        s = self._state
+        if not s['paused']:
+            deadline = s['deadline']
+            if deadline:
+                s['remaining_seconds'] = max(0, math.ceil(deadline - time.monotonic()))
+            s['paused'] = True
+        return s['remaining_seconds']
 
     def _resume_timer(self):
-        if self._state.get('paused'):
-            self._state['start_time'] = time.time()
-            self._state['paused'] = False
-        return self._state.get('remaining_seconds', 0)
+        s = self._state
+        if s['paused']:
+            s['deadline'] = time.monotonic() + s['remaining_seconds']
+            s['paused'] = False
+        return s['remaining_seconds']
 
     def _reset_timer(self, duration=None):
+        s = self._state
         if duration is not None:
-            self._state['total_seconds'] = duration
-        self._state['remaining_seconds'] = self._state.get('total_seconds', 0)
-        self._state['start_time'] = 0
-        self._state['paused'] = False
+            s['total_seconds'] = duration
+        s['remaining_seconds'] = s['total_seconds']
+        s['deadline'] = 0
+        s['paused'] = False
 
     def get_sanitized_state_data(self) -> dict:
         return {
-            'duration_seconds': self._state.get('duration_seconds', self._state.get('total_seconds', 180)),
+            'duration_seconds': self._state.get('total_seconds', 180),
             'message': self._state.get('message', '')
         }
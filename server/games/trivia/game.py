@@ -26,7 +26,7 @@ class TriviaGame(BaseGame):
         return EventResponse()
 
     def handle_submit_answer(self, data, context: EventContext) -> EventResponse:
-        team_id = context.team_id or data.get('team_id')
+        team_id = context.acting_team_id
         question_id = data.get('question_id')
         answer_text = data.get('answer_text', '')
         
@@ -60,8 +60,6 @@ class TriviaGame(BaseGame):
         }
         
         # Notify team
-        if team_id not in response.to_specific_team:
-            response.to_specific_team[team_id] = {}
         response.to_specific_team[team_id]['answer_submitted'] = {
             'player_id': context.player_id,
             'player_name': context.player_name,
@@ -80,7 +78,8 @@ class TriviaGame(BaseGame):
         response = EventResponse()
         text = data.get('text', '')
         
-        if context.team_id:
+        # Skip the fan-out when no teammate session could receive it
+        if context.team_id and self.session_manager.get_team_session_count(context.team_id) > 1:
              response.to_team_others['answer_sync'] = {
                 'text': text,
                 'from_player_id': context.player_id,
@@ -107,8 +106,6 @@ class TriviaGame(BaseGame):
         self._state['graded_teams'].add(team_id)
 
         # Notify team of result
-        if team_id not in response.to_specific_team:
-            response.to_specific_team[team_id] = {}
         response.to_specific_team[team_id]['answer_result'] = {
             'correct': correct,
             'points_awarded': points if correct else 0
@@ -123,10 +120,7 @@ class TriviaGame(BaseGame):
 
         if correct and points:
             self.session_manager.add_points(team_id, points, 'Trivia correct answer')
-            response.broadcast['score_update'] = {
-                'scores': self.session_manager.get_scores(),
-                'teams': self.session_manager.get_teams_info()
-            }
+            response.broadcast['score_update'] = self.session_manager.get_scores_payload()
 
         return response
 